@@ -1,5 +1,21 @@
 import random
 
+try:
+    import game_kernel
+except ImportError: # numba/numpy are optional; fall back to the pure Python solver
+    game_kernel = None
+
+# Flat-index lookup tables, built once at import: the row, column and box
+# of cell i, so the hot loops avoid divmod and box arithmetic per call.
+ROW_OF = tuple(i // 9 for i in range(81))
+COL_OF = tuple(i % 9 for i in range(81))
+BOX_OF = tuple((i // 9 // 3) * 3 + i % 9 // 3 for i in range(81))
+
+def generate_puzzle(level='easy'):
+    # Module-level so it can be shipped to worker processes by pickle.
+    generator = SudokuGenerator(level=level)
+    return generator.get_puzzle(), generator.get_solution()
+
 class SudokuGenerator:
     def __init__(self, level='easy'):
         self.board = [[0 for _ in range(9)] for _ in range(9)]
@@ -8,12 +24,19 @@ class SudokuGenerator:
         self._generate_solution()
 
     def _generate_solution(self):
-        self.solve(self.board)
+        board = bytearray(81)
+        if game_kernel is not None:
+            board = game_kernel.solve_random(board)
+        else:
+            row_mask, col_mask, box_mask = self._build_masks(board)
+            self.solve(board, row_mask, col_mask, box_mask)
+        self._flat_solution = bytes(board) # Flat form used by get_puzzle
+        self.board = [list(board[i * 9:(i + 1) * 9]) for i in range(9)]
         self.solution = [row[:] for row in self.board] # Store the solved board
 
     def get_puzzle(self):
-        puzzle = [row[:] for row in self.solution]
-        
+        puzzle = bytearray(self._flat_solution)
+
         # Adjust the number of cells to remove for each difficulty level.
         # Fewer removed cells lead to easier puzzles and faster generation.
         if self.level == 'easy':
@@ -30,91 +53,190 @@ class SudokuGenerator:
             squares_to_remove = 52
 
         # Create a list of all cells and shuffle them
-        cells = [(r, c) for r in range(9) for c in range(9)]
+        cells = list(range(81))
         random.shuffle(cells)
-        
+
         squares_removed = 0
-        
-        for r, c in cells:
+
+        for i in cells:
             if squares_removed >= squares_to_remove:
                 break
-
-            backup = puzzle[r][c]
-            puzzle[r][c] = 0
-            
-            board_copy = [row[:] for row in puzzle]
-            
-            if self.count_solutions(board_copy) != 1:
-                puzzle[r][c] = backup
+            if puzzle[i] == 0:
+                continue
+
+            # Remove point-symmetric pairs when possible so one uniqueness
+            # check covers two cells.
+            j = 80 - i
+            pair = j != i and puzzle[j] != 0 and squares_removed + 2 <= squares_to_remove
+
+            backup_i = puzzle[i]
+            puzzle[i] = 0
+            if pair:
+                backup_j = puzzle[j]
+                puzzle[j] = 0
+
+            unique = self._has_unique_solution(puzzle)
+            if not unique and pair:
+                # The pair broke uniqueness; retry with just this cell removed.
+                puzzle[j] = backup_j
+                pair = False
+                unique = self._has_unique_solution(puzzle)
+
+            if not unique:
+                puzzle[i] = backup_i
             else:
-                squares_removed += 1
-                
-        return puzzle
-
-    def count_solutions(self, board):
-        find = self.find_empty(board)
-        if not find:
-            return 1
-        else:
-            row, col = find
+                squares_removed += 2 if pair else 1
+
+        return [list(puzzle[i * 9:(i + 1) * 9]) for i in range(9)]
+
+    def _has_unique_solution(self, puzzle):
+        board_copy = bytearray(puzzle) # Single C-level copy
+        if game_kernel is not None:
+            return game_kernel.count_solutions(board_copy) == 1
+        row_mask, col_mask, box_mask = self._build_masks(board_copy)
+        return self.count_solutions(board_copy, row_mask, col_mask, box_mask) == 1
+
+    def count_solutions(self, board, row_mask, col_mask, box_mask, limit=2):
+        placed = self._propagate(board, row_mask, col_mask, box_mask)
+        if placed is None: # Contradiction
+            return 0
 
         count = 0
-        for num in range(1, 10):
-            if self.is_valid(board, num, (row, col)):
-                board[row][col] = num
-                count += self.count_solutions(board)
-                board[row][col] = 0 # Backtrack
-                if count > 1:
-                    return count
+        find = self.find_empty(board, row_mask, col_mask, box_mask)
+        if find is None:
+            count = 1
+        else:
+            i, cand = find
+            r = ROW_OF[i]
+            c = COL_OF[i]
+            b = BOX_OF[i]
+
+            while cand:
+                bit = cand & -cand
+                cand ^= bit
+
+                board[i] = bit.bit_length()
+                row_mask[r] |= bit
+                col_mask[c] |= bit
+                box_mask[b] |= bit
+
+                count += self.count_solutions(board, row_mask, col_mask, box_mask, limit - count)
+
+                # Backtrack
+                board[i] = 0
+                row_mask[r] ^= bit
+                col_mask[c] ^= bit
+                box_mask[b] ^= bit
+
+                if count >= limit:
+                    break
+
+        self._unplace(board, placed, row_mask, col_mask, box_mask)
         return count
 
     def get_solution(self):
         return self.solution
 
-    def solve(self, board):
-        find = self.find_empty(board)
-        if not find:
-            return True
-        else:
-            row, col = find
-
-        nums = list(range(1, 10))
-        random.shuffle(nums)
+    def solve(self, board, row_mask, col_mask, box_mask):
+        placed = self._propagate(board, row_mask, col_mask, box_mask)
+        if placed is None: # Contradiction
+            return False
 
-        for num in nums:
-            if self.is_valid(board, num, (row, col)):
-                board[row][col] = num
-
-                if self.solve(board):
-                    return True
+        find = self.find_empty(board, row_mask, col_mask, box_mask)
+        if find is None:
+            return True
 
-                board[row][col] = 0
+        i, cand = find
+        r = ROW_OF[i]
+        c = COL_OF[i]
+        b = BOX_OF[i]
+
+        bits = []
+        while cand:
+            bit = cand & -cand
+            cand ^= bit
+            bits.append(bit)
+        random.shuffle(bits)
+
+        for bit in bits:
+            board[i] = bit.bit_length()
+            row_mask[r] |= bit
+            col_mask[c] |= bit
+            box_mask[b] |= bit
+
+            if self.solve(board, row_mask, col_mask, box_mask):
+                return True
+
+            board[i] = 0
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[b] ^= bit
+
+        self._unplace(board, placed, row_mask, col_mask, box_mask)
         return False
 
-    def is_valid(self, board, num, pos):
-        # Check row
-        for i in range(len(board[0])):
-            if board[pos[0]][i] == num and pos[1] != i:
-                return False
-
-        # Check column
-        for i in range(len(board)):
-            if board[i][pos[1]] == num and pos[0] != i:
-                return False
-
-        # Check box
-        box_x = pos[1] // 3
-        box_y = pos[0] // 3
-
-        for i in range(box_y*3, box_y*3 + 3):
-            for j in range(box_x * 3, box_x*3 + 3):
-                if board[i][j] == num and (i,j) != pos:
-                    return False
-        return True
-
-    def find_empty(self, board):
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] == 0:
-                    return (i, j)  # row, col
-        return None
+    def find_empty(self, board, row_mask, col_mask, box_mask):
+        # MRV: pick the empty cell with the fewest candidates so the search
+        # branches as little as possible. Returns (index, candidate_mask),
+        # or None when the board is full. A cell with no candidates is
+        # returned as-is so the caller backtracks immediately.
+        best = None
+        best_count = 10
+        for i in range(81):
+            if board[i] == 0:
+                cand = 0x1FF & ~(row_mask[ROW_OF[i]] | col_mask[COL_OF[i]] | box_mask[BOX_OF[i]])
+                count = cand.bit_count()
+                if count < best_count:
+                    best = (i, cand)
+                    best_count = count
+                    if count <= 1:
+                        break
+        return best
+
+    def _propagate(self, board, row_mask, col_mask, box_mask):
+        # Fill naked singles (cells whose candidate mask has exactly one bit)
+        # to a fixed point before branching. Returns the list of filled
+        # indices so the caller can undo them, or None on a contradiction.
+        placed = []
+        changed = True
+        while changed:
+            changed = False
+            for i in range(81):
+                if board[i] == 0:
+                    r = ROW_OF[i]
+                    c = COL_OF[i]
+                    b = BOX_OF[i]
+                    cand = 0x1FF & ~(row_mask[r] | col_mask[c] | box_mask[b])
+                    if cand == 0:
+                        self._unplace(board, placed, row_mask, col_mask, box_mask)
+                        return None
+                    if cand & (cand - 1) == 0:
+                        board[i] = cand.bit_length()
+                        row_mask[r] |= cand
+                        col_mask[c] |= cand
+                        box_mask[b] |= cand
+                        placed.append(i)
+                        changed = True
+        return placed
+
+    def _unplace(self, board, placed, row_mask, col_mask, box_mask):
+        for i in placed:
+            bit = 1 << (board[i] - 1)
+            row_mask[ROW_OF[i]] ^= bit
+            col_mask[COL_OF[i]] ^= bit
+            box_mask[BOX_OF[i]] ^= bit
+            board[i] = 0
+
+    def _build_masks(self, board):
+        # One 9-bit mask per row/column/box: bit (d-1) set means digit d is used.
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        for i in range(81):
+            num = board[i]
+            if num:
+                bit = 1 << (num - 1)
+                row_mask[ROW_OF[i]] |= bit
+                col_mask[COL_OF[i]] |= bit
+                box_mask[BOX_OF[i]] |= bit
+        return row_mask, col_mask, box_mask
@@ -0,0 +1,207 @@
+# Numba-compiled solver kernels. Optional: game.py falls back to its pure
+# Python solver when numba/numpy are not installed. The kernels mirror the
+# bitmask solver in game.py but run as machine code on flat numpy arrays,
+# using explicit stacks instead of recursion (numba-friendly).
+import random
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _popcount(x):
+    n = 0
+    while x:
+        x &= x - 1
+        n += 1
+    return n
+
+
+@njit(cache=True)
+def _bit_to_num(bit):
+    n = 0
+    while bit:
+        bit >>= 1
+        n += 1
+    return n
+
+
+@njit(cache=True)
+def _select(board, row_mask, col_mask, box_mask):
+    # MRV: empty cell with the fewest candidates. Returns (index, mask);
+    # index -1 means the board is full.
+    best = -1
+    best_cand = 0
+    best_count = 10
+    for i in range(81):
+        if board[i] == 0:
+            r = i // 9
+            c = i % 9
+            b = (r // 3) * 3 + c // 3
+            cand = 0x1FF & ~(row_mask[r] | col_mask[c] | box_mask[b])
+            count = _popcount(cand)
+            if count < best_count:
+                best = i
+                best_cand = cand
+                best_count = count
+                if count <= 1:
+                    break
+    return best, best_cand
+
+
+@njit(cache=True)
+def nb_count_solutions(board, row_mask, col_mask, box_mask, limit):
+    cells = np.empty(81, np.int64)
+    cands = np.empty(81, np.int64)
+    count = 0
+
+    best, cand = _select(board, row_mask, col_mask, box_mask)
+    if best == -1:
+        return 1
+    depth = 0
+    cells[0] = best
+    cands[0] = cand
+
+    while True:
+        cand = cands[depth]
+        if cand == 0:
+            # Candidates exhausted here: undo the parent's placement.
+            depth -= 1
+            if depth < 0:
+                return count
+            i = cells[depth]
+            bit = 1 << (board[i] - 1)
+            r = i // 9
+            c = i % 9
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[(r // 3) * 3 + c // 3] ^= bit
+            board[i] = 0
+            continue
+
+        bit = cand & -cand
+        cands[depth] = cand ^ bit
+        i = cells[depth]
+        r = i // 9
+        c = i % 9
+        b = (r // 3) * 3 + c // 3
+        board[i] = _bit_to_num(bit)
+        row_mask[r] |= bit
+        col_mask[c] |= bit
+        box_mask[b] |= bit
+
+        nxt, ncand = _select(board, row_mask, col_mask, box_mask)
+        if nxt == -1:
+            count += 1
+            if count >= limit:
+                return count
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[b] ^= bit
+            board[i] = 0
+            continue
+        if ncand == 0:
+            # Dead end: undo and try the next candidate at this depth.
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[b] ^= bit
+            board[i] = 0
+            continue
+        depth += 1
+        cells[depth] = nxt
+        cands[depth] = ncand
+
+
+@njit(cache=True)
+def nb_solve_random(board, row_mask, col_mask, box_mask, seed):
+    np.random.seed(seed)
+    cells = np.empty(81, np.int64)
+    cands = np.empty(81, np.int64)
+
+    best, cand = _select(board, row_mask, col_mask, box_mask)
+    if best == -1:
+        return True
+    depth = 0
+    cells[0] = best
+    cands[0] = cand
+
+    while True:
+        cand = cands[depth]
+        if cand == 0:
+            depth -= 1
+            if depth < 0:
+                return False
+            i = cells[depth]
+            bit = 1 << (board[i] - 1)
+            r = i // 9
+            c = i % 9
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[(r // 3) * 3 + c // 3] ^= bit
+            board[i] = 0
+            continue
+
+        # Pick a random candidate bit so generated solutions vary.
+        k = np.random.randint(_popcount(cand))
+        m = cand
+        for _ in range(k):
+            m &= m - 1
+        bit = m & -m
+        cands[depth] = cand ^ bit
+
+        i = cells[depth]
+        r = i // 9
+        c = i % 9
+        b = (r // 3) * 3 + c // 3
+        board[i] = _bit_to_num(bit)
+        row_mask[r] |= bit
+        col_mask[c] |= bit
+        box_mask[b] |= bit
+
+        nxt, ncand = _select(board, row_mask, col_mask, box_mask)
+        if nxt == -1:
+            return True
+        if ncand == 0:
+            row_mask[r] ^= bit
+            col_mask[c] ^= bit
+            box_mask[b] ^= bit
+            board[i] = 0
+            continue
+        depth += 1
+        cells[depth] = nxt
+        cands[depth] = ncand
+
+
+def _to_arrays(flat_board):
+    board = np.zeros(81, np.uint8)
+    row_mask = np.zeros(9, np.int64)
+    col_mask = np.zeros(9, np.int64)
+    box_mask = np.zeros(9, np.int64)
+    for i in range(81):
+        num = flat_board[i]
+        if num:
+            board[i] = num
+            r, c = divmod(i, 9)
+            bit = 1 << (num - 1)
+            row_mask[r] |= bit
+            col_mask[c] |= bit
+            box_mask[(r // 3) * 3 + c // 3] |= bit
+    return board, row_mask, col_mask, box_mask
+
+
+def count_solutions(flat_board, limit=2):
+    board, row_mask, col_mask, box_mask = _to_arrays(flat_board)
+    return int(nb_count_solutions(board, row_mask, col_mask, box_mask, limit))
+
+
+def solve_random(flat_board):
+    board, row_mask, col_mask, box_mask = _to_arrays(flat_board)
+    seed = random.randrange(2 ** 31 - 1)
+    if nb_solve_random(board, row_mask, col_mask, box_mask, seed):
+        return bytearray(int(x) for x in board)
+    return None
+
+
+# Warm the JIT at import so the first request doesn't pay compile time.
+solve_random(bytearray(81))
+count_solutions(bytearray(81), limit=1)
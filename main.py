@@ -1,21 +1,56 @@
-import eventlet
-eventlet.monkey_patch()
-from flask import Flask, request, jsonify
-from flask_socketio import SocketIO, emit, join_room, leave_room
+from gevent import monkey
+# thread, os and signal stay unpatched: the puzzle ProcessPoolExecutor needs
+# real OS threads and real fork/waitpid to drive its worker processes, and
+# everything it shares with the greenlets (queues, locks) is safe either way.
+monkey.patch_all(thread=False, os=False, signal=False)
+from gevent.lock import RLock
+from flask import Flask, Response, request, jsonify
+from flask_socketio import SocketIO, emit, join_room
 from flask_cors import CORS, cross_origin
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
 import uuid
 import random
-import threading
+import queue
 import time
+import msgpack
+import orjson
+
+class _OrjsonModule:
+    # python-socketio takes any module-like object with dumps/loads; orjson
+    # returns bytes, so wrap it to hand back str for the packet encoder.
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Set REDIS_URL (e.g. redis://localhost:6379/0) to share room membership and
+# broadcasts across multiple worker processes behind sticky sessions; needs
+# the redis package installed. Unset, the server runs single-process as before.
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='gevent', json=_OrjsonModule,
+                    message_queue=os.environ.get('REDIS_URL'))
 
-from game import SudokuGenerator
+from game import SudokuGenerator, generate_puzzle
 
 rooms = {}
 
+# Reverse index so disconnects resolve in O(1) instead of scanning rooms.
+sid_to_player = {}
+
+# Fewest players a game can start with, per mode.
+MIN_PLAYERS = {
+    'multiplayer': 2,
+    'solo': 1,
+}
+
 DIFFICULTY_TIME_LIMITS = {
     'easy': 8 * 60,
     'medium': 10 * 60,
@@ -25,21 +60,84 @@ DIFFICULTY_TIME_LIMITS = {
     'extreme': 30 * 60,
 }
 
+# Puzzle generation is CPU-heavy, so keep a small pool of pre-generated
+# puzzles per difficulty topped up by background threads. create_room pops
+# from the pool and only generates inline when the pool is empty.
+POOL_SIZE = 32
+
+puzzle_pools = {level: queue.Queue(maxsize=POOL_SIZE) for level in DIFFICULTY_TIME_LIMITS}
+
+# Generation itself runs in worker processes so it uses other cores and never
+# holds up the event loop; the green producer threads just wait on futures.
+_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+def _puzzle_producer(level):
+    pool = puzzle_pools[level]
+    while True:
+        try:
+            future = _executor.submit(generate_puzzle, level)
+        except RuntimeError: # Executor torn down; the process is exiting
+            return
+        # Poll instead of blocking on the future: threads are left unpatched
+        # by the monkey-patch above, so future.result() on a pending future
+        # would park the whole event loop on a native lock.
+        while not future.done():
+            socketio.sleep(0.1)
+        result = future.result()
+        while True:
+            try:
+                pool.put_nowait(result)
+                break
+            except queue.Full:
+                socketio.sleep(1)
+
+def _take_puzzle(difficulty):
+    try:
+        return puzzle_pools[difficulty].get_nowait()
+    except (KeyError, queue.Empty):
+        # Same polling discipline as the producers: result() on a pending
+        # future would park the whole event loop on a native lock.
+        future = _executor.submit(generate_puzzle, difficulty)
+        while not future.done():
+            socketio.sleep(0.05)
+        return future.result()
+
+for _level in DIFFICULTY_TIME_LIMITS:
+    socketio.start_background_task(_puzzle_producer, _level)
+
 class GameState:
-    def __init__(self, puzzle, solution):
-        self.puzzle = puzzle
-        self.solution = solution
-        self.current_board = [row[:] for row in puzzle]
-        self.board_history = []
-        self.notes_board = [[[] for _ in range(9)] for _ in range(9)]
+    def __init__(self, room):
+        self.current_board = bytearray(room.flat_puzzle)
+        self.empty_cells = {i for i in range(81) if self.current_board[i] == 0}
+        self.history = deque(maxlen=50) # (r, c, prev_value, prev_notes_mask); undo depth is capped
+        # One 9-bit mask per cell: bit (d-1) set means digit d is noted.
+        # Clearing or restoring a cell's notes is a single int assignment.
+        self.notes_board = array('H', [0] * 81)
+        self._cached_dict = None
+
+    def set_cell(self, r, c, value):
+        i = r * 9 + c
+        self.current_board[i] = value
+        if value:
+            self.empty_cells.discard(i)
+        else:
+            self.empty_cells.add(i)
+        self._cached_dict = None
+
+    def set_notes(self, r, c, mask):
+        self.notes_board[r * 9 + c] = mask
+        self._cached_dict = None
 
     def to_dict(self):
-        return {
-            "puzzle": self.puzzle,
-            "solution": self.solution,
-            "current_board": self.current_board,
-            "notes_board": self.notes_board
-        }
+        # Rebuilt only after a mutation; every emit in between reuses it.
+        if self._cached_dict is None:
+            # The puzzle itself is immutable and was delivered with the
+            # create/join response, so resyncs only carry the mutable state.
+            self._cached_dict = {
+                "current_board": [list(self.current_board[i * 9:(i + 1) * 9]) for i in range(9)],
+                "notes_board": [list(self.notes_board[i * 9:(i + 1) * 9]) for i in range(9)]
+            }
+        return self._cached_dict
 
 class Player:
     def __init__(self, id, name):
@@ -54,30 +152,88 @@ class Player:
         self.sid = None
 
 class Room:
-    def __init__(self, id, host_id, puzzle, solution, difficulty):
+    def __init__(self, id, host_id, puzzle, solution, difficulty, game_mode='multiplayer'):
         self.id = id
+        self.game_mode = game_mode
         self.players = {}
         self.host_id = host_id
         self.game_started = False
         self.game_over = False
         self.puzzle = puzzle
         self.solution = solution
+        # Flat copies: players' boards start from flat_puzzle and the
+        # per-move/completion checks compare against flat_solution bytes.
+        self.flat_puzzle = bytes(cell for row in puzzle for cell in row)
+        self.flat_solution = bytes(cell for row in solution for cell in row)
+        # The puzzle never changes, so serialize it once and let the HTTP
+        # responses splice the bytes in instead of re-encoding 81 ints each.
+        self.puzzle_json = orjson.dumps(puzzle)
         self.difficulty = difficulty
         self.time_limit = DIFFICULTY_TIME_LIMITS.get(difficulty)
-        self.timer = None
+        self.timer_cancelled = False
         self.start_time = None
+        # Guards player/board mutations. Must be gevent-aware: handlers emit
+        # while holding it, and an emit can yield to the hub (e.g. a Redis
+        # publish with a message_queue configured). A native lock here would
+        # park the only OS thread if another greenlet tried to acquire it
+        # while the holder was parked mid-emit.
+        self.lock = RLock()
+        # Sorted leaderboard cache; cleared whenever membership, score or a
+        # finished/eliminated flag changes.
+        self._player_info_cache = None
+        self._info_broadcast_scheduled = False
+
+def _room_response(room, fields):
+    # Splice the room's pre-serialized puzzle into the orjson-encoded fields.
+    head = orjson.dumps(fields)
+    return Response(head[:-1] + b',"puzzle":' + room.puzzle_json + b'}',
+                    mimetype='application/json')
 
 def _get_player_info(room):
-    info = [
-        {"player_id": p_id, "player_name": p.name, "eliminated": p.eliminated, "finished": p.finished, "score": p.score}
-        for p_id, p in room.players.items()
-    ]
-    return sorted(info, key=lambda p: p['score'], reverse=True)
+    if room._player_info_cache is None:
+        info = [
+            {"player_id": p_id, "player_name": p.name, "eliminated": p.eliminated, "finished": p.finished, "score": p.score}
+            for p_id, p in room.players.items()
+        ]
+        room._player_info_cache = sorted(info, key=lambda p: p['score'], reverse=True)
+    return room._player_info_cache
+
+def _player_stats(player):
+    # The mistakes/hints/score trio that every per-action emit carries.
+    return {
+        "mistakes": player.mistakes,
+        "hints": player.hints_used,
+        "score": player.score
+    }
+
+def _pack(payload):
+    # The largest frames ship as msgpack binary attachments instead of JSON:
+    # ~30-50% smaller for these integer-heavy arrays and cheaper to encode.
+    # Clients decode them with msgpack-lite.
+    return msgpack.packb(payload)
+
+PLAYER_INFO_DEBOUNCE = 0.05 # Seconds to coalesce bursts of player-info updates
+
+def _flush_player_info(room_id):
+    socketio.sleep(PLAYER_INFO_DEBOUNCE)
+    room = rooms.get(room_id)
+    if not room:
+        return
+    room._info_broadcast_scheduled = False
+    if room.players:
+        socketio.emit('current_players', _pack({"players": _get_player_info(room)}), to=room_id)
 
 def _broadcast_player_info(room_id):
+    # Debounced: the first call in a burst schedules one room broadcast a few
+    # ms out and the rest ride along. Returns the fresh player list so
+    # callers can fold it into the acting player's own payload immediately.
     room = rooms.get(room_id)
-    if room:
-        emit('current_players', {"players": _get_player_info(room)}, to=room_id)
+    if not room or not room.players:
+        return None
+    if not room._info_broadcast_scheduled:
+        room._info_broadcast_scheduled = True
+        socketio.start_background_task(_flush_player_info, room_id)
+    return _get_player_info(room)
 
 def check_game_over(room_id):
     room = rooms.get(room_id)
@@ -86,20 +242,31 @@ def check_game_over(room_id):
 
     all_done = all(p.finished or p.eliminated for p in room.players.values())
     if all_done:
-        if room.timer:
-            room.timer.cancel()
+        room.timer_cancelled = True
         room.game_started = False
         room.game_over = True
-        leaderboard = _get_player_info(room)
-        emit('game_over', {"leaderboard": leaderboard, "message": "All players have finished!"}, to=room_id)
+        if room.players:
+            leaderboard = _get_player_info(room)
+            emit('game_over', {"leaderboard": leaderboard, "message": "All players have finished!"}, to=room_id)
+
+def _deadline_task(room_id, seconds):
+    # Runs on the event loop instead of a dedicated threading.Timer thread
+    # per room; "cancelling" just sets the room's flag, re-checked on wake.
+    socketio.sleep(seconds)
+    room = rooms.get(room_id)
+    if room and not room.timer_cancelled:
+        end_game_by_timer(room_id)
 
 def end_game_by_timer(room_id):
     room = rooms.get(room_id)
-    if room and room.game_started:
+    # game_over can already be set if the last player finished while the
+    # timer was firing; don't end the game twice.
+    if room and room.game_started and not room.game_over:
         room.game_started = False
         room.game_over = True
-        leaderboard = _get_player_info(room)
-        socketio.emit('game_over', {"leaderboard": leaderboard, "message": "Time's up!"}, to=room_id)
+        if room.players:
+            leaderboard = _get_player_info(room)
+            socketio.emit('game_over', {"leaderboard": leaderboard, "message": "Time's up!"}, to=room_id)
 
 @app.route("/")
 def index():
@@ -117,28 +284,23 @@ def create_room():
             return jsonify({"error": "Player name is required"}), 400
 
         room_id = str(uuid.uuid4())[:8]
-        generator = SudokuGenerator(level=difficulty)
-        puzzle = generator.get_puzzle()
-        solution = generator.get_solution()
+        puzzle, solution = _take_puzzle(difficulty)
 
         host_player = Player(id=str(uuid.uuid4()), name=player_name)
-        host_player.game_state = GameState(puzzle, solution)
 
         game_mode = data.get('game_mode', 'multiplayer') # Default to multiplayer
 
+        room = Room(id=room_id, host_id=host_player.id, puzzle=puzzle, solution=solution,
+                    difficulty=difficulty, game_mode=game_mode)
         if game_mode == 'solo':
-            room = Room(id=room_id, host_id=host_player.id, puzzle=puzzle, solution=solution, difficulty=difficulty)
             room.time_limit = None # No time limit for solo mode
-        else:
-            room = Room(id=room_id, host_id=host_player.id, puzzle=puzzle, solution=solution, difficulty=difficulty)
+        host_player.game_state = GameState(room)
         room.players[host_player.id] = host_player
         rooms[room_id] = room
 
-        return jsonify({
+        return _room_response(room, {
             "room_id": room_id,
             "player_id": host_player.id,
-            "puzzle": puzzle,
-            "solution": solution,
             "difficulty": difficulty,
             "message": "Room created successfully"
         })
@@ -165,18 +327,14 @@ def join_room_route():
         if room.game_started:
             return jsonify({"error": "Game has already started"}), 403
 
-        puzzle = room.puzzle
-        solution = room.solution
-
         player = Player(id=str(uuid.uuid4()), name=player_name)
-        player.game_state = GameState(puzzle, solution)
+        player.game_state = GameState(room)
         room.players[player.id] = player
+        room._player_info_cache = None
 
-        return jsonify({
+        return _room_response(room, {
             "room_id": room_id,
             "player_id": player.id,
-            "puzzle": puzzle,
-            "solution": solution,
             "difficulty": room.difficulty,
             "message": "Joined room successfully"
         })
@@ -194,7 +352,12 @@ def on_join(data):
         return
 
     player = room.players[player_id]
+    # A rejoin gets a fresh sid; drop the stale entry so the old socket's
+    # disconnect can't remove a player who is still connected.
+    if player.sid and player.sid != request.sid:
+        sid_to_player.pop(player.sid, None)
     player.sid = request.sid
+    sid_to_player[request.sid] = (room_id, player_id)
 
     _broadcast_player_info(room_id)
 
@@ -207,19 +370,31 @@ def on_start_game(data):
     if not room or player_id != room.host_id:
         return
 
+    if len(room.players) < MIN_PLAYERS.get(room.game_mode, 1):
+        emit('error', {"message": "Not enough players to start!"}, room=request.sid)
+        return
+
     room.game_started = True
     room.start_time = time.time()
     if room.time_limit:
-        room.timer = threading.Timer(room.time_limit, end_game_by_timer, [room_id])
-        room.timer.start()
+        room.timer_cancelled = False
+        socketio.start_background_task(_deadline_task, room_id, room.time_limit)
 
     emit('game_started', {"message": "Game started!", "start_time": room.start_time}, to=room_id)
 
+def _valid_cell(r, c):
+    return isinstance(r, int) and isinstance(c, int) and 0 <= r < 9 and 0 <= c < 9
+
 @socketio.on('move')
 def on_move(data):
-    room_id = data['room_id']
-    player_id = data['player_id']
-    r, c, value = data["row"], data["col"], data["value"]
+    room_id = data.get('room_id')
+    player_id = data.get('player_id')
+    r, c, value = data.get("row"), data.get("col"), data.get("value")
+
+    # Reject malformed input before touching the board or history.
+    if not _valid_cell(r, c) or not isinstance(value, int) or not 0 <= value <= 9:
+        emit('error', {"message": "Invalid move."}, room=request.sid)
+        return
 
     room = rooms.get(room_id)
     if not room or player_id not in room.players or not room.game_started:
@@ -231,46 +406,80 @@ def on_move(data):
         
     gs = player.game_state
 
-    gs.board_history.append([row[:] for row in gs.current_board])
-    gs.current_board[r][c] = value
-    gs.notes_board[r][c] = []
-
-    is_correct = True
-    if value != 0:
-        if gs.solution[r][c] != value:
-            is_correct = False
-            player.mistakes += 1
-            player.score -= 20
-            if player.mistakes >= 3:
-                player.eliminated = True
-                emit('player_eliminated', {"player_id": player.id, "player_name": player.name}, to=room_id)
-                emit('eliminated', {"message": "You have been eliminated!"}, room=request.sid)
+    with room.lock:
+        gs.history.append((r, c, gs.current_board[r * 9 + c], gs.notes_board[r * 9 + c]))
+        gs.set_cell(r, c, value)
+        gs.set_notes(r, c, 0)
+
+        is_correct = True
+        if value != 0:
+            room._player_info_cache = None
+            if room.solution[r][c] != value:
+                is_correct = False
+                player.mistakes += 1
+                player.score -= 20
+                if player.mistakes >= 3:
+                    player.eliminated = True
+                    emit('player_eliminated', {"player_id": player.id, "player_name": player.name}, to=room_id)
+                    emit('eliminated', {"message": "You have been eliminated!"}, room=request.sid)
+                    check_game_over(room_id)
+            else:
+                player.score += 50
+
+        players_info = _broadcast_player_info(room_id)
+
+        emit('cell_update', {
+            "row": r,
+            "col": c,
+            "value": value,
+            "is_correct": is_correct,
+            "players": players_info,
+            **_player_stats(player)
+        }, room=request.sid)
+
+        # empty_cells is maintained by set_cell, so board-full is an O(1)
+        # check instead of scanning 81 bytes after every move.
+        if not gs.empty_cells:
+            if gs.current_board == room.flat_solution:
+                player.finished = True
+                room._player_info_cache = None
+                player.finish_time = time.time() - room.start_time
+                emit('player_finished', {"player_id": player.id, "player_name": player.name}, to=room_id)
                 check_game_over(room_id)
-        else:
-            player.score += 50
 
-    _broadcast_player_info(room_id)
+@socketio.on('notes')
+def on_notes(data):
+    room_id = data.get('room_id')
+    player_id = data.get('player_id')
+    r, c, notes = data.get("row"), data.get("col"), data.get("notes")
 
-    emit('game_state_update', {
-        "game_state": gs.to_dict(),
-        "mistakes": player.mistakes,
-        "hints": player.hints_used,
-        "score": player.score,
-        "last_move": {"row": r, "col": c, "value": value, "is_correct": is_correct}
-    }, room=request.sid)
+    if (not _valid_cell(r, c) or not isinstance(notes, list) or len(notes) > 9
+            or any(not isinstance(d, int) or not 1 <= d <= 9 for d in notes)):
+        emit('error', {"message": "Invalid notes."}, room=request.sid)
+        return
 
-    if all(all(cell != 0 for cell in row) for row in gs.current_board):
-        if gs.current_board == gs.solution:
-            player.finished = True
-            player.finish_time = time.time() - room.start_time
-            emit('player_finished', {"player_id": player.id, "player_name": player.name}, to=room_id)
-            check_game_over(room_id)
+    room = rooms.get(room_id)
+    if not room or player_id not in room.players:
+        return
 
-@socketio.on('notes')
-def on_notes(data):
+    player = room.players[player_id]
+    gs = player.game_state
+
+    mask = 0
+    for d in notes:
+        mask |= 1 << (d - 1)
+
+    with room.lock:
+        gs.set_notes(r, c, mask)
+        emit('note_update', {"row": r, "col": c, "notes": mask}, room=request.sid)
+
+@socketio.on('resync')
+def on_resync(data):
+    # Full-state fallback: clients apply cell_update/note_update deltas and
+    # only ask for a complete game_state_update after a reconnect or when
+    # they detect they are out of sync.
     room_id = data['room_id']
     player_id = data['player_id']
-    r, c, notes = data["row"], data["col"], data["notes"]
 
     room = rooms.get(room_id)
     if not room or player_id not in room.players:
@@ -279,13 +488,10 @@ def on_notes(data):
     player = room.players[player_id]
     gs = player.game_state
 
-    gs.notes_board[r][c] = notes
-    emit('game_state_update', {
+    emit('game_state_update', _pack({
         "game_state": gs.to_dict(),
-        "mistakes": player.mistakes,
-        "hints": player.hints_used,
-        "score": player.score
-    }, room=request.sid)
+        **_player_stats(player)
+    }), room=request.sid)
 
 @socketio.on('undo')
 def on_undo(data):
@@ -299,16 +505,21 @@ def on_undo(data):
     player = room.players[player_id]
     gs = player.game_state
 
-    if gs.board_history:
-        gs.current_board = gs.board_history.pop()
-        emit('game_state_update', {
-            "game_state": gs.to_dict(),
-            "mistakes": player.mistakes,
-            "hints": player.hints_used,
-            "score": player.score
-        }, room=request.sid)
-    else:
-        emit('error', {"message": "Nothing to undo!"}, room=request.sid)
+    with room.lock:
+        if gs.history:
+            r, c, prev_value, prev_notes = gs.history.pop()
+            gs.set_cell(r, c, prev_value)
+            gs.set_notes(r, c, prev_notes)
+            emit('note_update', {"row": r, "col": c, "notes": prev_notes}, room=request.sid)
+            emit('cell_update', {
+                "row": r,
+                "col": c,
+                "value": prev_value,
+                "is_correct": True,
+                **_player_stats(player)
+            }, room=request.sid)
+        else:
+            emit('error', {"message": "Nothing to undo!"}, room=request.sid)
 
 @socketio.on('hint')
 def on_hint(data):
@@ -322,57 +533,55 @@ def on_hint(data):
     player = room.players[player_id]
     gs = player.game_state
 
-    if player.hints_used < 3:
-        empty_cells = [(r, c) for r in range(9) for c in range(9) if gs.current_board[r][c] == 0]
-        if empty_cells:
-            r, c = random.choice(empty_cells)
-            hint_value = gs.solution[r][c]
-            gs.current_board[r][c] = hint_value
-            player.hints_used += 1
-            player.score += 25
-
-            _broadcast_player_info(room_id)
-
-            emit('hint_given', {"row": r, "col": c, "value": hint_value, "hints_used": player.hints_used, "score": player.score}, room=request.sid)
-            emit('game_state_update', {"game_state": gs.to_dict(), "mistakes": player.mistakes, "hints": player.hints_used, "score": player.score}, room=request.sid)
+    with room.lock:
+        if player.hints_used < 3:
+            if gs.empty_cells:
+                # Pick the k-th element of the set directly instead of
+                # copying all empty cells into a tuple first.
+                k = random.randrange(len(gs.empty_cells))
+                r, c = divmod(next(islice(gs.empty_cells, k, None)), 9)
+                hint_value = room.solution[r][c]
+                gs.set_cell(r, c, hint_value)
+                player.hints_used += 1
+                player.score += 25
+                room._player_info_cache = None
+
+                players_info = _broadcast_player_info(room_id)
+
+                emit('hint_given', {"row": r, "col": c, "value": hint_value, "hints_used": player.hints_used, "players": players_info, **_player_stats(player)}, room=request.sid)
+            else:
+                emit('error', {"message": "No empty cells for a hint!"}, room=request.sid)
         else:
-            emit('error', {"message": "No empty cells for a hint!"}, room=request.sid)
-    else:
-        emit('error', {"message": "No hints left!"}, room=request.sid)
+            emit('error', {"message": "No hints left!"}, room=request.sid)
 
 @socketio.on('disconnect')
 def on_disconnect():
-    player_to_remove = None
-    room_of_player = None
-    
-    for room in rooms.values():
-        for p_id, p in room.players.items():
-            if p.sid == request.sid:
-                player_to_remove = p
-                room_of_player = room
-                break
-        if player_to_remove:
-            break
+    entry = sid_to_player.pop(request.sid, None)
+    if not entry:
+        return
 
-    if player_to_remove and room_of_player:
-        player_id = player_to_remove.id
-        player_name = player_to_remove.name
-        
-        del room_of_player.players[player_id]
-        
-        leave_room(room_of_player.id)
-        
-        emit('player_left', {"player_id": player_id, "player_name": player_name}, to=room_of_player.id)
-        
-        _broadcast_player_info(room_of_player.id)
-        
-        if room_of_player.game_started and len(room_of_player.players) > 0:
-            check_game_over(room_of_player.id)
-        elif len(room_of_player.players) == 0:
-            if room_of_player.timer:
-                room_of_player.timer.cancel()
-            if room_of_player.id in rooms:
-                del rooms[room_of_player.id]
+    room_id, player_id = entry
+    room = rooms.get(room_id)
+    if not room or player_id not in room.players:
+        return
+
+    player = room.players.pop(player_id)
+    room._player_info_cache = None
+
+    # No leave_room here: Socket.IO already removes a disconnecting sid
+    # from all of its rooms.
+    if not room.players:
+        # Last player out; tear the room down without broadcasting to it.
+        room.timer_cancelled = True
+        del rooms[room_id]
+        return
+
+    emit('player_left', {"player_id": player_id, "player_name": player.name}, to=room_id)
+
+    _broadcast_player_info(room_id)
+
+    if room.game_started:
+        check_game_over(room_id)
 
 if __name__ == '__main__':
     socketio.run(app, debug=True)